@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+ZellerDay批量输出基准测试 | ZellerDay Batch Output Benchmark
+测量批量输出的写入吞吐量（MB/s） | Measures the write throughput of batch output (MB/s)
+
+用法 | Usage:
+    python benchmarks/bench_output.py [行数 | rows]
+"""
+
+import contextlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from zeller_day import io_utils
+from zeller_day.core import calculate_weekday
+from zeller_day.language import set_language
+from zeller_day.output_writer import OutputWriter, ResultFormatter
+
+def _report(name: str, size: int, seconds: float) -> None:
+    """输出一项基准结果 | Print one benchmark result"""
+    print(f"{name:<28} {size / 1e6:8.1f} MB {seconds:8.3f} s {size / 1e6 / seconds:8.1f} MB/s")
+
+def bench_writer(rows: list, path: str) -> None:
+    """只测量 OutputWriter 写入预先格式化的行 | Measure OutputWriter alone writing preformatted rows"""
+    start = time.perf_counter()
+    with OutputWriter(path) as writer:
+        write = writer.write
+        for row in rows:
+            write(row)
+    _report("OutputWriter", writer.bytes_written, time.perf_counter() - start)
+
+def bench_format_and_write(dates: list, path: str) -> None:
+    """测量逐行格式化并写入 | Measure per-row formatting plus writing"""
+    formatter = ResultFormatter()
+    start = time.perf_counter()
+    with OutputWriter(path) as writer:
+        write = writer.write
+        for date_str, (year, month, day) in dates:
+            write(formatter.format_result(date_str, year, month, day, calculate_weekday(year, month, day, False)) + "\n")
+    _report("format + OutputWriter", writer.bytes_written, time.perf_counter() - start)
+
+def bench_batch_file(source: str) -> None:
+    """测量完整的 process_batch_file（标准输出重定向到空设备） | Measure the full process_batch_file (stdout redirected to devnull)"""
+    start = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        io_utils.process_batch_file(source, "1")
+    base, ext = os.path.splitext(source)
+    _report("process_batch_file", os.path.getsize(f"{base}{io_utils.RESULT_SUFFIX}{ext}"), time.perf_counter() - start)
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    set_language("en")
+    rng = random.Random(0)
+    dates = []
+    for _ in range(count):
+        year, month, day = rng.randint(1600, 2400), rng.randint(1, 12), rng.randint(1, 28)
+        dates.append((f"{year}-{month}-{day}", (year, month, day)))
+    formatter = ResultFormatter()
+    rows = [formatter.format_result(date_str, *date, calculate_weekday(*date, False)) + "\n" for date_str, date in dates]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        io_utils.LOG_DIR = Path(tmp) / "logs"
+        source = os.path.join(tmp, "dates.txt")
+        with open(source, "w", encoding="utf-8") as f:
+            f.writelines(date_str + "\n" for date_str, _ in dates)
+        print(f"{count} rows")
+        bench_writer(rows, os.path.join(tmp, "writer.txt"))
+        bench_format_and_write(dates, os.path.join(tmp, "format.txt"))
+        bench_batch_file(source)
+
+if __name__ == "__main__":
+    main()
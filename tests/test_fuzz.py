@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+ZellerDay批量随机测试 | ZellerDay Bulk Fuzz Tests
+将 calculate_weekday 与独立的按天计数参考实现对比，并将 validate_date_input 的解析结果与预期元组对比。 | Cross-checks calculate_weekday against an independent day-count oracle, and validate_date_input parse results against expected tuples.
+
+环境变量 | Environment variables:
+    ZELLERDAY_FUZZ_COUNT: 随机用例总数（默认100000，可设为数百万） | Total number of random cases (default 100000, can be set to millions)
+    ZELLERDAY_FUZZ_SHARDS: 分片数，每个分片在单独的进程中运行（默认为CPU数） | Number of shards, each run in its own process (default: CPU count)
+    ZELLERDAY_FUZZ_SEED: 基础随机种子（默认随机） | Base random seed (random by default)
+    ZELLERDAY_FUZZ_REPLAY: 在当前进程中重放指定种子的分片 | Replay the shard with the given seed in the current process
+"""
+
+import datetime
+import multiprocessing
+import os
+import random
+import unittest
+from typing import List, Tuple
+
+from zeller_day.calendars import get_calendar
+from zeller_day.core import calculate_weekday
+from zeller_day.date_utils import validate_date_input
+
+# 每个分片最多报告的失败数 | Maximum number of failures reported per shard
+MAX_FAILURES = 10
+
+# 参与对比的历法及其转换日期（None表示不转换） | Calendars under test and their cutover dates (None for no cutover)
+CALENDAR_CUTOVERS = {
+    "julian": None,
+    "gregorian": None,
+    "hybrid": (1582, 10, 15),
+    "britain": (1752, 9, 14),
+}
+
+MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _is_leap(year: int, gregorian: bool) -> bool:
+    """闰年规则（天文年份） | Leap year rule (astronomical year)"""
+    if gregorian:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return year % 4 == 0
+
+def _days_in_month(year: int, month: int, gregorian: bool) -> int:
+    """某月的天数（天文年份） | Number of days in a month (astronomical year)"""
+    if month == 2 and _is_leap(year, gregorian):
+        return 29
+    return MONTH_DAYS[month - 1]
+
+def _build_day_table(cycle: int, gregorian: bool) -> Tuple[List[int], List[List[int]]]:
+    """
+    按天数累加构建一个闰年周期内每年第一天和每月第一天的偏移量 | Build offsets of the first day of each year and month within one leap cycle by counting days
+    周期长度（儒略历28年，公历400年）的总天数都是7的倍数，因此星期在周期间重复。 | The total days of a cycle (28 Julian years, 400 Gregorian years) is a multiple of 7, so weekdays repeat between cycles.
+    """
+    year_starts = [0]
+    month_starts = []
+    for year in range(cycle):
+        starts = [0]
+        for month in range(1, 13):
+            starts.append(starts[-1] + _days_in_month(year, month, gregorian))
+        month_starts.append(starts)
+        year_starts.append(year_starts[-1] + starts[12])
+    assert year_starts[cycle] % 7 == 0
+    return year_starts, month_starts
+
+_TABLES = {False: _build_day_table(28, False), True: _build_day_table(400, True)}
+
+def _day_index(year: int, month: int, day: int, gregorian: bool) -> int:
+    """天文年份日期在闰年周期内的天数序号 | Day index of an astronomical-year date within its leap cycle"""
+    year_starts, month_starts = _TABLES[gregorian]
+    cycle_year = year % (len(year_starts) - 1)
+    return year_starts[cycle_year] + month_starts[cycle_year][month - 1] + day - 1
+
+# 锚点：公历2000-01-01（由datetime得出）与儒略历1582-10-04（星期四） | Anchors: Gregorian 2000-01-01 (from datetime) and Julian 1582-10-04 (Thursday)
+_ANCHORS = {
+    True: ((datetime.date(2000, 1, 1).weekday() + 2) - _day_index(2000, 1, 1, True)) % 7,
+    False: (5 - _day_index(1582, 10, 4, False)) % 7,
+}
+
+def oracle_weekday(year: int, month: int, day: int, gregorian: bool) -> int:
+    """
+    参考实现：按天计数得出星期（0-6，对应星期六到星期五） | Reference implementation: weekday by day counting (0-6, Saturday through Friday)
+    
+    参数 | Parameters:
+        year: 年份（负数表示公元前） | Year (negative numbers represent BCE)
+        month: 月份 | Month
+        day: 日期 | Day
+        gregorian: 是否使用公历 | Whether to use the Gregorian calendar
+    """
+    if year <= 0:
+        year += 1
+    return (_ANCHORS[gregorian] + _day_index(year, month, day, gregorian)) % 7
+
+def _random_year(rng: random.Random) -> int:
+    """随机的非零年份 | Random non-zero year"""
+    year = rng.randint(-9999, 9998)
+    return year + 1 if year >= 0 else year
+
+def _check_weekday(rng: random.Random, name: str, cutover) -> str:
+    """生成一个随机日期并检查星期，返回失败描述或空字符串 | Generate a random date and check its weekday, returning a failure description or an empty string"""
+    year = _random_year(rng)
+    month = rng.randint(1, 12)
+    if cutover is None:
+        gregorian = name == "gregorian"
+    else:
+        gregorian = (year, month) >= cutover[:2]
+    astronomical = year + 1 if year <= 0 else year
+    day = rng.randint(1, _days_in_month(astronomical, month, gregorian))
+    date = (year, month, day)
+    calendar = get_calendar(name)
+    if cutover is not None:
+        gregorian = date >= cutover
+        if not gregorian and date > calendar.julian_last:
+            try:
+                calculate_weekday(year, month, day, False, calendar)
+            except ValueError:
+                return ""
+            return f"{name} {date}: expected ValueError in calendar gap"
+    expected = oracle_weekday(year, month, day, gregorian)
+    try:
+        actual = calculate_weekday(year, month, day, False, calendar)
+    except ValueError as ve:
+        return f"{name} {date}: unexpected ValueError {ve}"
+    if actual != expected:
+        return f"{name} {date}: weekday {actual}, expected {expected}"
+    return ""
+
+def _format_case(rng: random.Random) -> Tuple[str, str, Tuple[int, int, int]]:
+    """
+    生成一个随机格式的日期字符串 | Generate a randomly formatted date string
+    
+    返回 | Returns:
+        (日期字符串, 解析顺序策略, 预期元组) | (Date string, parsing order policy, expected tuple)
+    """
+    delimiter = rng.choice("-/.")
+    order = rng.choice(("ymd", "dmy", "mdy"))
+    if rng.random() < 0.25:
+        year = rng.randint(-9999, -1)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, MONTH_DAYS[month - 1])
+        year_str = str(year)
+    else:
+        year = rng.randint(1, 9999)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, _days_in_month(year, month, True))
+        # 两位以内的年份必须补零，否则无法与月、日区分 | Years of at most two digits must be zero-padded, otherwise they cannot be told apart from months and days
+        year_str = str(year) if year > 31 and rng.random() < 0.5 else str(year).zfill(4)
+    month_str = str(month).zfill(2) if rng.random() < 0.5 else str(month)
+    day_str = str(day).zfill(2) if rng.random() < 0.5 else str(day)
+    if order == "ymd":
+        parts = (year_str, month_str, day_str)
+    elif order == "dmy":
+        parts = (day_str, month_str, year_str)
+    else:
+        parts = (month_str, day_str, year_str)
+    padding = " " * rng.randint(0, 2)
+    return padding + delimiter.join(parts) + padding, order, (year, month, day)
+
+def _check_parse(rng: random.Random) -> str:
+    """生成一个随机日期字符串并检查解析结果，返回失败描述或空字符串 | Generate a random date string and check the parse result, returning a failure description or an empty string"""
+    date_str, order, expected = _format_case(rng)
+    try:
+        actual = validate_date_input(date_str, order)
+    except ValueError as ve:
+        return f"parse {date_str!r} ({order}): unexpected ValueError {ve}"
+    if actual != expected:
+        return f"parse {date_str!r} ({order}): {actual}, expected {expected}"
+    return ""
+
+def run_shard(args: Tuple[int, int]) -> List[str]:
+    """
+    运行一个分片的随机用例 | Run the random cases of one shard
+    
+    参数 | Parameters:
+        args: (分片种子, 用例数) | (Shard seed, number of cases)
+    
+    返回 | Returns:
+        失败描述列表 | List of failure descriptions
+    """
+    seed, count = args
+    rng = random.Random(seed)
+    failures = []
+    for index in range(count):
+        for name, cutover in CALENDAR_CUTOVERS.items():
+            failure = _check_weekday(rng, name, cutover)
+            if failure:
+                failures.append(f"seed={seed} case={index}: {failure}")
+        failure = _check_parse(rng)
+        if failure:
+            failures.append(f"seed={seed} case={index}: {failure}")
+        if len(failures) >= MAX_FAILURES:
+            break
+    return failures
+
+class TestZellerDayFuzz(unittest.TestCase):
+    """ZellerDay批量随机测试类 | ZellerDay Bulk Fuzz Test Class"""
+
+    def test_oracle_anchors(self):
+        """测试参考实现本身 | Test the reference implementation itself"""
+        for _ in range(1000):
+            date = datetime.date.fromordinal(random.randint(1, datetime.date.max.toordinal()))
+            self.assertEqual(oracle_weekday(date.year, date.month, date.day, True), (date.weekday() + 2) % 7)
+        # 公元1年1月1日（儒略历）为星期六 | 1 January AD 1 (Julian) was a Saturday
+        self.assertEqual(oracle_weekday(1, 1, 1, False), 0)
+
+    def test_fuzz(self):
+        """将随机日期与参考实现对比 | Cross-check random dates against the reference implementation"""
+        count = int(os.environ.get("ZELLERDAY_FUZZ_COUNT", "100000"))
+        shards = int(os.environ.get("ZELLERDAY_FUZZ_SHARDS", str(os.cpu_count() or 1)))
+        per_shard = -(-count // shards)
+        replay = os.environ.get("ZELLERDAY_FUZZ_REPLAY")
+        if replay is not None:
+            # 重放模式：在当前进程中重放单个分片，便于调试 | Replay mode: replay a single shard in the current process for debugging
+            failures = run_shard((int(replay), per_shard))
+        else:
+            base_seed = int(os.environ.get("ZELLERDAY_FUZZ_SEED", str(random.randrange(2 ** 32))))
+            tasks = [(base_seed + shard, per_shard) for shard in range(shards)]
+            if shards == 1:
+                results = [run_shard(tasks[0])]
+            else:
+                with multiprocessing.Pool(shards) as pool:
+                    results = pool.map(run_shard, tasks)
+            failures = [failure for result in results for failure in result]
+        self.assertFalse(failures, "\n".join(failures) + f"\nReplay a shard with ZELLERDAY_FUZZ_REPLAY=<seed> ZELLERDAY_FUZZ_COUNT={count} ZELLERDAY_FUZZ_SHARDS={shards}")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,9 +6,18 @@ ZellerDay单元测试 | ZellerDay Unit Tests
 import unittest
 import sys
 import os
+import io
+import tempfile
+import contextlib
+from pathlib import Path
 
 from zeller_day.core import calculate_weekday, map_weekday
+from zeller_day.calendars import get_calendar
+from zeller_day.output_writer import OutputWriter, ResultFormatter
 from zeller_day.date_utils import validate_date_input, is_valid_date
+from zeller_day.io_utils import collect_batch_files, process_stream, process_batch_file, process_batch_files
+from zeller_day import calendars, language, io_utils
+from zeller_day.language import get_text
 
 class TestZellerDay(unittest.TestCase):
     """ZellerDay测试类 | ZellerDay Test Class"""
@@ -21,6 +30,41 @@ class TestZellerDay(unittest.TestCase):
         self.assertEqual(calculate_weekday(2025, 2, 24), 2)
         # 测试2020-02-29，预期星期六 (返回值为0) | Test 2020-02-29, expected Saturday (return value 0)
         self.assertEqual(calculate_weekday(2020, 2, 29), 0)
+        # 测试儒略历日期：0001-01-01 为星期六，1582-10-04 为星期四 | Test Julian dates: 0001-01-01 is Saturday, 1582-10-04 is Thursday
+        self.assertEqual(calculate_weekday(1, 1, 1), 0)
+        self.assertEqual(calculate_weekday(1582, 10, 4), 5)
+        self.assertRaises(ValueError, calculate_weekday, 1582, 10, 10)
+    
+    def test_calendars(self):
+        """测试历法引擎功能 | Test calendar engine functionality"""
+        britain = get_calendar("britain")
+        # 英国1752年9月2日星期三之后是9月14日星期四 | In Britain, Wednesday 1752-09-02 was followed by Thursday 1752-09-14
+        self.assertEqual(britain.weekday(1752, 9, 2), 4)
+        self.assertEqual(britain.weekday(1752, 9, 14), 5)
+        self.assertRaises(ValueError, britain.weekday, 1752, 9, 5)
+        self.assertEqual(get_calendar("hybrid:1752-09-14").julian_last, (1752, 9, 2))
+        self.assertEqual(get_calendar("gregorian").weekday(1582, 10, 10), get_calendar("julian").weekday(1582, 9, 30))
+        self.assertEqual(calculate_weekday(1582, 10, 10, calendar=get_calendar("gregorian")), 1)
+        # 测试ISO周历 | Test ISO week date
+        self.assertEqual(get_calendar("iso").week_date(2021, 1, 3), (2020, 53, 7))
+        self.assertEqual(get_calendar("iso").format_date(2025, 2, 24), "2025-W09-1")
+        # 公元前的ISO年份使用带符号的扩展格式 | BCE ISO years use the signed expanded form
+        self.assertEqual(get_calendar("iso").format_date(-5, 1, 1), "-0004-W01-1")
+        self.assertEqual(get_calendar("iso").format_date(-1, 6, 1), "+0000-W22-4")
+        self.assertRaises(ValueError, get_calendar, "unknown")
+        # 转换日期必须是合法的公历日期，自定义混合历不注册 | The cutover must be a valid Gregorian date, custom hybrid calendars are not registered
+        self.assertRaises(ValueError, get_calendar, "hybrid:2000-02-30")
+        get_calendar("hybrid:1700-03-01")
+        self.assertNotIn("hybrid:1700-03-01", calendars.CALENDARS)
+        # 按各历法自己的闰年规则验证日期 | Validate dates by each calendar's own leap year rule
+        self.assertTrue(britain.is_valid_date(1700, 2, 29))
+        self.assertFalse(britain.is_valid_date(1800, 2, 29))
+        self.assertTrue(get_calendar("julian").is_valid_date(1900, 2, 29))
+        self.assertFalse(get_calendar("gregorian").is_valid_date(1900, 2, 29))
+        self.assertTrue(get_calendar("hybrid").is_valid_date(1500, 2, 29))
+        self.assertFalse(get_calendar("hybrid").is_valid_date(1700, 2, 29))
+        self.assertTrue(get_calendar("hybrid").is_valid_date(-1, 2, 29))
+        self.assertFalse(get_calendar("hybrid").is_valid_date(2025, 4, 31))
     
     def test_validate_date_input(self):
         """测试日期验证和解析功能 | Test date validation and parsing functionality"""
@@ -33,6 +77,15 @@ class TestZellerDay(unittest.TestCase):
         self.assertEqual(validate_date_input("-1.1.1"), (-1, 1, 1))
         # 测试无歧义数字相同的情况，如 "1-1-1" | Test unambiguous cases where all numbers are the same, such as "1-1-1"
         self.assertEqual(validate_date_input("1-1-1"), (1, 1, 1))
+        # 测试按策略解析歧义输入 | Test resolving ambiguous input by policy
+        self.assertEqual(validate_date_input("3-2-1", "ymd"), (3, 2, 1))
+        self.assertEqual(validate_date_input("3-2-1", "dmy"), (1, 2, 3))
+        self.assertEqual(validate_date_input("3-2-1", "mdy"), (1, 3, 2))
+        self.assertEqual(validate_date_input("2.3.2222", "mdy"), (2222, 2, 3))
+        self.assertEqual(validate_date_input("2/3/-5", "dmy"), (-5, 3, 2))
+        # 2月29日交由历法验证 | February 29 is left to the calendar to validate
+        self.assertEqual(validate_date_input("29.2.1700"), (1700, 2, 29))
+        self.assertRaises(ValueError, validate_date_input, "1700-02-30")
     
     def test_is_valid_date(self):
         """测试日期合法性验证功能 | Test date validity verification functionality"""
@@ -51,5 +104,176 @@ class TestZellerDay(unittest.TestCase):
         self.assertEqual(map_weekday(2), "星期一")
         self.assertEqual(map_weekday(6), "星期五")
 
+    def test_collect_batch_files(self):
+        """测试批量文件收集功能 | Test batch file collection functionality"""
+        with tempfile.TemporaryDirectory() as tmp:
+            sub = os.path.join(tmp, "sub")
+            os.makedirs(sub)
+            for name in ["a.txt", "a_result.txt", os.path.join("sub", "b.log")]:
+                with open(os.path.join(tmp, name), "w", encoding="utf-8") as f:
+                    f.write("2025-01-01\n")
+            a = os.path.join(tmp, "a.txt")
+            b = os.path.join(sub, "b.log")
+            # 目录递归遍历并跳过结果文件 | Directories are walked recursively and result files are skipped
+            self.assertEqual(collect_batch_files([tmp]), [a, b])
+            # 通配符展开并去重 | Glob patterns are expanded and de-duplicated
+            self.assertEqual(collect_batch_files([os.path.join(tmp, "*.txt"), a]), [a])
+            # 按真实路径去重，保留第一次出现的写法 | De-duplicated by real path, keeping the first spelling
+            self.assertEqual(collect_batch_files([a, os.path.join(tmp, ".", "a.txt")]), [a])
+            self.assertEqual(collect_batch_files([tmp, os.path.join(sub, "..", "a.txt")]), [a, b])
+            self.assertEqual(collect_batch_files([os.path.join(tmp, "**", "*.log")]), [b])
+            # 日志目录被跳过 | The log directory is skipped
+            self.addCleanup(setattr, io_utils, "LOG_DIR", io_utils.LOG_DIR)
+            io_utils.LOG_DIR = Path(sub)
+            self.assertEqual(collect_batch_files([tmp]), [a])
+    
+    def test_process_batch_files(self):
+        """测试多文件批量处理功能 | Test multi-file batch processing functionality"""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.addCleanup(setattr, io_utils, "LOG_DIR", io_utils.LOG_DIR)
+            io_utils.LOG_DIR = Path(tmp) / "logs"
+            sub = os.path.join(tmp, "sub")
+            os.makedirs(sub)
+            sources = {
+                os.path.join(tmp, "a.txt"): "2025-01-01\n2025-02-30\n",
+                os.path.join(sub, "b.log"): "2025-01-02\n\n3-2-1\n",
+            }
+            for path, text in sources.items():
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(text)
+            # 无法解码的文件计为失败，不影响其他文件 | An undecodable file counts as failed without affecting other files
+            binary = os.path.join(sub, "a.bin")
+            with open(binary, "wb") as f:
+                f.write(b"\xff\xfe\x00\x01\n")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertEqual(process_batch_files([tmp], "1", workers=2, order="ymd"), (2, 3, 1))
+            self.assertIn(get_text("batch_summary", 2, 3, 1, 1), out.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(sub, "a_result.bin")))
+            # 每个结果文件写在源文件旁边 | Each result file is written next to its source
+            for path, text in sources.items():
+                base, ext = os.path.splitext(path)
+                with open(f"{base}_result{ext}", "r", encoding="utf-8") as f:
+                    self.assertEqual(len(f.readlines()), len(text.splitlines()))
+            # 再次运行时跳过结果文件和日志目录 | Result files and the log directory are skipped on the next run
+            os.remove(binary)
+            self.assertEqual(process_batch_files([tmp], "1", order="ymd"), (2, 3, 1))
+
+    def test_process_stream(self):
+        """测试流式过滤功能 | Test streaming filter functionality"""
+        self.addCleanup(language.set_language, language.current_language)
+        language.set_language("en")
+        out = io.StringIO()
+        counts = process_stream(io.StringIO("2025-02-24\n\n2.3.2222\nbad\n1-2000-3\n"), out, "mdy")
+        self.assertEqual(counts, (2, 2))
+        lines = out.getvalue().split("\n")
+        self.assertEqual(lines[0], "2025-02-24 -> 2025-02-24 is Monday.")
+        self.assertEqual(lines[1], "")
+        self.assertEqual(lines[2], "2.3.2222 -> 2222-02-03 is Sunday.")
+        self.assertTrue(lines[3].startswith("Date 'bad' is invalid"))
+        # 年份位于中间时报告错误而不是中断 | A year in the middle is reported as an error instead of aborting
+        self.assertEqual(lines[4], get_text("invalid_date_error", "1-2000-3", get_text("date_format_error") + get_text("cannot_identify_year")))
+        # 按当前历法验证：英国1700年仍使用儒略历 | Validated by the current calendar: Britain still used the Julian calendar in 1700
+        self.addCleanup(calendars.set_calendar, calendars.current_calendar)
+        calendars.set_calendar(get_calendar("britain"))
+        out = io.StringIO()
+        self.assertEqual(process_stream(io.StringIO("1700-02-29\n1800-02-29\n"), out, "ymd"), (1, 1))
+        self.assertEqual(out.getvalue().split("\n")[0], "1700-02-29 -> 1700-02-29 is Thursday.")
+
+    def test_process_batch_file_incremental(self):
+        """测试增量批量处理功能 | Test incremental batch processing functionality"""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.addCleanup(setattr, io_utils, "LOG_DIR", io_utils.LOG_DIR)
+            io_utils.LOG_DIR = Path(tmp) / "logs"
+            source = os.path.join(tmp, "dates.txt")
+            result = os.path.join(tmp, "dates_result.txt")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("2025-01-01\n2025-01-02\n")
+            self.assertEqual(process_batch_file(source, "1", incremental=True), (2, 0))
+            # 追加内容后只处理新的完整行 | After appending, only new complete lines are processed
+            with open(source, "a", encoding="utf-8") as f:
+                f.write("2025-01-03\n2025-01")
+            self.assertEqual(process_batch_file(source, "1", incremental=True), (1, 0))
+            with open(result, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 3)
+            # 已处理前缀被修改时从头重新处理 | Reprocess from the start when the processed prefix changed
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("2025-02-01\n2025-01-02\n2025-01-03\n2025-01-04\n")
+            self.assertEqual(process_batch_file(source, "1", incremental=True), (4, 0))
+            with open(result, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), 4)
+            self.assertTrue(lines[0].startswith("2025-02-01"))
+            # 语言改变时从头重新处理；分行规则与 readlines() 一致 | Reprocess from the start when the language changed; lines split like readlines()
+            self.addCleanup(language.set_language, language.current_language)
+            language.set_language("en" if language.current_language == "zh" else "zh")
+            with open(source, "a", encoding="utf-8") as f:
+                f.write("2025-01-05\x0c\n")
+            self.assertEqual(process_batch_file(source, "1", incremental=True), (5, 0))
+            with open(result, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 5)
+            # 解析顺序策略改变时从头重新处理 | Reprocess from the start when the order policy changed
+            with open(source, "a", encoding="utf-8") as f:
+                f.write("01/02/2025\n")
+            self.assertEqual(process_batch_file(source, "1", incremental=True, order="dmy"), (6, 0))
+            with open(source, "a", encoding="utf-8") as f:
+                f.write("01/02/2025\n")
+            self.assertEqual(process_batch_file(source, "1", incremental=True, order="mdy"), (7, 0))
+            with open(result, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+            self.assertEqual(lines[5], lines[6])
+            self.assertIn(get_text("date_format", 2025, 1, 2), lines[5])
+
+    def test_output_writer(self):
+        """测试结果格式化和输出写入功能 | Test result formatting and output writing functionality"""
+        self.addCleanup(language.set_language, language.current_language)
+        for lang in ("zh", "en"):
+            language.set_language(lang)
+            formatter = ResultFormatter()
+            for year, month, day in [(2025, 2, 24), (233, 1, 1), (-1414, 5, 14)]:
+                weekday = calculate_weekday(year, month, day, False)
+                expected = get_text("batch_result", "x", get_calendar("hybrid").format_date(year, month, day), map_weekday(weekday))
+                self.assertEqual(formatter.format_result("x", year, month, day, weekday), expected)
+        self.assertEqual(ResultFormatter(get_calendar("iso")).format_date(2025, 2, 24), "2025-W09-1")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.txt")
+            with OutputWriter(path, chunk_rows=2) as writer:
+                for row in ["a\n", "星期一\n", "c\n"]:
+                    writer.write(row)
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "a\n星期一\nc\n")
+            self.assertEqual(writer.bytes_written, os.path.getsize(path))
+
+    def test_process_batch_file_modify(self):
+        """测试修改原文件模式 | Test the modify-original-file mode"""
+        with tempfile.TemporaryDirectory() as tmp:
+            self.addCleanup(setattr, io_utils, "LOG_DIR", io_utils.LOG_DIR)
+            io_utils.LOG_DIR = Path(tmp) / "logs"
+            source = os.path.join(tmp, "dates.txt")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("2025-01-01\n-5-1-1\n")
+            os.chmod(source, 0o640)
+            with open(source + ".tmp", "w", encoding="utf-8") as f:
+                f.write("keep")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertEqual(process_batch_file(source, "2", order="ymd"), (2, 0))
+            # 回显的结果与调试信息保持原有顺序 | Echoed results stay in order with debug information
+            echoed = out.getvalue()
+            self.assertLess(echoed.index("2025-01-01 ->"), echoed.index(get_text("astronomical_year", -5, -4)))
+            # 保留权限，且不影响同名的 .tmp 文件 | Permissions are kept and a same-named .tmp file is left alone
+            self.assertEqual(os.stat(source).st_mode & 0o777, 0o640)
+            with open(source + ".tmp", "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "keep")
+            self.assertEqual(sorted(os.listdir(tmp)), ["dates.txt", "dates.txt.tmp", "logs"])
+            # 符号链接保持不变，修改其指向的文件 | A symlink stays in place and its target is modified
+            link = os.path.join(tmp, "link.txt")
+            os.symlink(source, link)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(process_batch_file(link, "2", order="ymd"), (0, 2))
+            self.assertTrue(os.path.islink(link))
+            with open(source, "r", encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 2)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
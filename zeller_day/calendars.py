@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+ZellerDay历法引擎模块 | ZellerDay Calendar Engine Module
+包含可注册的表驱动历法（儒略历、公历、可配置转换日期的混合历、ISO周历） | Contains registered, table-driven calendars (Julian, Gregorian, hybrid with configurable cutover, ISO week date)
+"""
+
+from typing import Dict, Tuple
+
+from zeller_day.date_utils import format_date
+from zeller_day.language import get_text
+
+# 各月份在蔡勒公式中的月份项（1、2月视为上一年的13、14月） | Month term of Zeller's formula for each month (January and February count as months 13 and 14 of the previous year)
+MONTH_TERMS = (0,) + tuple((13 * ((m + 12 if m < 3 else m) + 1)) // 5 for m in range(1, 13))
+
+# 平年各月份的天数 | Number of days in each month of a common year
+MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _astronomical_year(year: int, month: int) -> int:
+    """
+    将历史年份转换为蔡勒公式使用的年份 | Convert a historical year to the year used by Zeller's formula
+    公元前年份先转换为天文年份（公元前1年为第0年），1、2月再归入上一年。 | BCE years are first converted to astronomical years (1 BCE is year 0), then January and February are counted in the previous year.
+    """
+    if year <= 0:
+        year += 1
+    if month < 3:
+        year -= 1
+    return year
+
+def _gregorian_to_jdn(year: int, month: int, day: int) -> int:
+    """将天文年份的公历日期转换为儒略日数 | Convert a Gregorian date (astronomical year) to a Julian day number"""
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+def _jdn_to_date(jdn: int, gregorian: bool) -> Tuple[int, int, int]:
+    """将儒略日数转换为天文年份的公历或儒略历日期 | Convert a Julian day number to a Gregorian or Julian date (astronomical year)"""
+    if gregorian:
+        a = jdn + 32044
+        b = (4 * a + 3) // 146097
+        c = a - 146097 * b // 4
+    else:
+        b = 0
+        c = jdn + 32082
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = 100 * b + d - 4800 + m // 10
+    return year, month, day
+
+class Calendar:
+    """历法基类 | Calendar base class"""
+
+    name = ""
+
+    def is_leap_year(self, year: int) -> bool:
+        """
+        判断该历法中某年是否为闰年 | Determine whether a year is a leap year in this calendar
+        
+        参数 | Parameters:
+            year: 年份（支持负数表示公元前） | Year (negative numbers represent BCE)
+        
+        返回 | Returns:
+            布尔值表示是否为闰年 | Boolean indicating whether it is a leap year
+        """
+        raise NotImplementedError
+
+    def is_valid_date(self, year: int, month: int, day: int) -> bool:
+        """
+        按该历法的闰年规则验证日期合法性 | Validate a date by the leap year rule of this calendar
+        
+        参数 | Parameters:
+            year: 年份（支持负数表示公元前） | Year (negative numbers represent BCE)
+            month: 月份 | Month
+            day: 日期 | Day
+        
+        返回 | Returns:
+            布尔值表示日期是否合法 | Boolean indicating whether the date is valid
+        """
+        if not 1 <= month <= 12 or day < 1:
+            return False
+        if month == 2 and day == 29:
+            return self.is_leap_year(year)
+        return day <= MONTH_DAYS[month]
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        """
+        计算指定日期的星期 | Calculate the day of the week for a specified date
+        
+        参数 | Parameters:
+            year: 年份（支持负数表示公元前） | Year (negative numbers represent BCE)
+            month: 月份（1-12） | Month (1-12)
+            day: 日期（1-31） | Day (1-31)
+        
+        返回 | Returns:
+            整数表示的星期（0-6，对应星期六到星期五） | Integer representing the day of the week (0-6, corresponding to Saturday through Friday)
+        """
+        raise NotImplementedError
+
+    def format_date(self, year: int, month: int, day: int) -> str:
+        """
+        按该历法格式化日期 | Format a date for this calendar
+        
+        参数 | Parameters:
+            year: 年份 | Year
+            month: 月份 | Month
+            day: 日期 | Day
+        
+        返回 | Returns:
+            格式化的日期字符串 | Formatted date string
+        """
+        return format_date(year, month, day)
+
+class JulianCalendar(Calendar):
+    """儒略历（外推） | Proleptic Julian calendar"""
+
+    name = "julian"
+
+    def is_leap_year(self, year: int) -> bool:
+        return (year + 1 if year <= 0 else year) % 4 == 0
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        y = _astronomical_year(year, month)
+        return (day + MONTH_TERMS[month] + y + y // 4 + 5) % 7
+
+class GregorianCalendar(Calendar):
+    """公历（外推） | Proleptic Gregorian calendar"""
+
+    name = "gregorian"
+
+    def is_leap_year(self, year: int) -> bool:
+        y = year + 1 if year <= 0 else year
+        return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        y = _astronomical_year(year, month)
+        return (day + MONTH_TERMS[month] + y + y // 4 - y // 100 + y // 400) % 7
+
+class HybridCalendar(Calendar):
+    """
+    混合历：转换日期之前使用儒略历，之后使用公历 | Hybrid calendar: Julian before the cutover date, Gregorian from it on
+    转换相关的常量只在创建时计算一次。 | Cutover constants are computed once on creation.
+    """
+
+    def __init__(self, name: str, cutover: Tuple[int, int, int]):
+        """
+        参数 | Parameters:
+            name: 历法名称 | Calendar name
+            cutover: 第一个公历日期 (年, 月, 日) | First Gregorian date (year, month, day)
+        """
+        if not GregorianCalendar().is_valid_date(*cutover):
+            raise ValueError(get_text("invalid_cutover", format_date(*cutover)))
+        self.name = name
+        self.cutover = cutover
+        jdn = _gregorian_to_jdn(*cutover)
+        # 儒略历的最后一天，以及空档期的第一天和最后一天 | Last Julian day, and first and last day of the gap
+        self.julian_last = _jdn_to_date(jdn - 1, gregorian=False)
+        if self.julian_last >= cutover:
+            raise ValueError(get_text("invalid_cutover", format_date(*cutover)))
+        self.gap_start = _jdn_to_date(jdn, gregorian=False)
+        self.gap_end = _jdn_to_date(jdn - 1, gregorian=True)
+
+    def is_leap_year(self, year: int) -> bool:
+        """按该年2月29日所适用的历法判断 | Decided by the calendar in force on February 29 of that year"""
+        y = year + 1 if year <= 0 else year
+        if year > self.cutover[0] or (year, 2, 29) >= self.cutover:
+            return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+        return y % 4 == 0
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        y = year + 1 if year <= 0 else year
+        if month < 3:
+            y -= 1
+        # 先只比较年份，避免为大多数日期构造元组 | Compare the year alone first to avoid building a tuple for most dates
+        if year > self.cutover[0] or (year, month, day) >= self.cutover:
+            return (day + MONTH_TERMS[month] + y + y // 4 - y // 100 + y // 400) % 7
+        if year < self.julian_last[0] or (year, month, day) <= self.julian_last:
+            return (day + MONTH_TERMS[month] + y + y // 4 + 5) % 7
+        raise ValueError(get_text("calendar_gap", format_date(*self.gap_start), format_date(*self.gap_end)))
+
+class ISOWeekCalendar(GregorianCalendar):
+    """ISO 8601 周历：星期与外推公历相同，日期以周历形式显示 | ISO 8601 week date: weekdays follow the proleptic Gregorian calendar, dates are shown as week dates"""
+
+    name = "iso"
+
+    def week_date(self, year: int, month: int, day: int) -> Tuple[int, int, int]:
+        """
+        计算ISO周历日期 | Calculate the ISO week date
+        
+        参数 | Parameters:
+            year: 年份（支持负数表示公元前） | Year (negative numbers represent BCE)
+            month: 月份 | Month
+            day: 日期 | Day
+        
+        返回 | Returns:
+            (ISO年份, 周数, 星期几（1为星期一）)，年份为天文年份 | (ISO year, week number, weekday with 1 for Monday), the year is astronomical
+        """
+        if year <= 0:
+            year += 1
+        jdn = _gregorian_to_jdn(year, month, day)
+        iso_weekday = jdn % 7 + 1
+        # 所在周星期四所属的年份即为ISO年份 | The ISO year is the year containing the Thursday of that week
+        iso_year = _jdn_to_date(jdn + 4 - iso_weekday, gregorian=True)[0]
+        # 第1周是包含1月4日的那一周 | Week 1 is the week containing January 4
+        january_4 = _gregorian_to_jdn(iso_year, 1, 4)
+        week_one = january_4 - january_4 % 7
+        return iso_year, (jdn - week_one) // 7 + 1, iso_weekday
+
+    def format_date(self, year: int, month: int, day: int) -> str:
+        """ISO年份为天文年份，不大于0时按ISO 8601扩展格式带符号并至少四位（公元前5年为 -0004） | The ISO year is astronomical; when not positive it uses the ISO 8601 expanded form with a sign and at least four digits (5 BCE is -0004)"""
+        iso_year, week, iso_weekday = self.week_date(year, month, day)
+        year_str = f"{iso_year:04d}" if iso_year > 0 else f"{iso_year:+05d}"
+        return f"{year_str}-W{week:02d}-{iso_weekday}"
+
+# 已注册的历法 | Registered calendars
+CALENDARS: Dict[str, Calendar] = {}
+
+def register_calendar(calendar: Calendar) -> Calendar:
+    """
+    注册历法 | Register a calendar
+    
+    参数 | Parameters:
+        calendar: 历法实例 | Calendar instance
+    
+    返回 | Returns:
+        注册的历法实例 | The registered calendar instance
+    """
+    CALENDARS[calendar.name] = calendar
+    return calendar
+
+register_calendar(JulianCalendar())
+register_calendar(GregorianCalendar())
+register_calendar(HybridCalendar("hybrid", (1582, 10, 15)))
+register_calendar(HybridCalendar("britain", (1752, 9, 14)))
+register_calendar(ISOWeekCalendar())
+
+def get_calendar(spec: str) -> Calendar:
+    """
+    按名称获取历法，"hybrid:YYYY-MM-DD" 表示以指定日期为转换日期的混合历（新建，不注册） | Get a calendar by name, "hybrid:YYYY-MM-DD" means a new, unregistered hybrid calendar with the given cutover date
+    
+    参数 | Parameters:
+        spec: 历法名称或混合历描述 | Calendar name or hybrid calendar specification
+    
+    返回 | Returns:
+        历法实例 | Calendar instance
+    """
+    spec = spec.strip().lower()
+    if spec in CALENDARS:
+        return CALENDARS[spec]
+    if spec.startswith("hybrid:"):
+        try:
+            year, month, day = (int(part) for part in spec.split(":", 1)[1].split("-"))
+        except ValueError:
+            raise ValueError(get_text("unknown_calendar", spec, ", ".join(CALENDARS)))
+        return HybridCalendar(spec, (year, month, day))
+    raise ValueError(get_text("unknown_calendar", spec, ", ".join(CALENDARS)))
+
+# 当前历法 | Current calendar
+current_calendar = CALENDARS["hybrid"]
+
+def set_calendar(calendar: Calendar) -> None:
+    """
+    设置当前历法 | Set the current calendar
+    
+    参数 | Parameters:
+        calendar: 历法实例 | Calendar instance
+    """
+    global current_calendar
+    current_calendar = calendar
@@ -4,15 +4,20 @@ ZellerDay命令行界面 | ZellerDay Command Line Interface
 处理用户交互和命令行参数 | Handles user interaction and command line arguments
 """
 
+import os
 import sys
-import datetime
 from typing import Tuple, Optional
 
+from zeller_day import calendars
+from zeller_day.calendars import get_calendar, set_calendar
 from zeller_day.core import calculate_weekday, map_weekday
-from zeller_day.date_utils import validate_date_input, is_valid_date, format_date
-from zeller_day.io_utils import log_query, process_batch_file
+from zeller_day.date_utils import validate_date_input, DATE_ORDERS
+from zeller_day.io_utils import log_query, process_batch_files, process_stream
 from zeller_day.language import get_text, set_language, detect_language
 
+# 过滤模式的输入输出缓冲区大小 | Input/output buffer size for filter mode
+FILTER_BUFFER_SIZE = 1 << 16
+
 def process_date(year: int, month: int, day: int) -> str:
     """
     处理日期并返回结果 | Process the date and return the result
@@ -25,9 +30,10 @@ def process_date(year: int, month: int, day: int) -> str:
     返回 | Returns:
         处理结果字符串 | Result string
     """
-    weekday_index = calculate_weekday(year, month, day)
+    calendar = calendars.current_calendar
+    weekday_index = calculate_weekday(year, month, day, calendar=calendar)
     weekday_str = map_weekday(weekday_index)
-    formatted_date = format_date(year, month, day)
+    formatted_date = calendar.format_date(year, month, day)
     result = get_text("result_format", formatted_date, weekday_str)
     log_query(f"{year:04d}-{month:02d}-{day:02d}", weekday_str)
     return result
@@ -48,17 +54,10 @@ def validate_and_process_date(date_input: str) -> Optional[str]:
         print(ve)
         return None
     
-    # 验证日期合法性 | Validate date legality
-    if year > 0:
-        try:
-            datetime.datetime(year, month, day)
-        except ValueError:
-            print(get_text("invalid_date"))
-            return None
-    else:
-        if not is_valid_date(year, month, day):
-            print(get_text("invalid_date"))
-            return None
+    # 按当前历法验证日期合法性 | Validate date legality by the current calendar
+    if not calendars.current_calendar.is_valid_date(year, month, day):
+        print(get_text("invalid_date"))
+        return None
     
     return process_date(year, month, day)
 
@@ -81,17 +80,10 @@ def interactive_mode():
             print(get_text("invalid_input"))
             return
         
-        # 验证日期合法性 | Validate date legality
-        if year > 0:
-            try:
-                datetime.datetime(year, month, day)
-            except ValueError:
-                print(get_text("invalid_date"))
-                return
-        else:
-            if not is_valid_date(year, month, day):
-                print(get_text("invalid_date"))
-                return
+        # 按当前历法验证日期合法性 | Validate date legality by the current calendar
+        if not calendars.current_calendar.is_valid_date(year, month, day):
+            print(get_text("invalid_date"))
+            return
         
         result = process_date(year, month, day)
         print(f"\n{result}。")
@@ -120,17 +112,10 @@ def interactive_mode():
                 print(get_text("invalid_input"))
                 continue
             
-            # 验证日期合法性 | Validate date legality
-            if year > 0:
-                try:
-                    datetime.datetime(year, month, day)
-                except ValueError:
-                    print(get_text("invalid_date"))
-                    continue
-            else:
-                if not is_valid_date(year, month, day):
-                    print(get_text("invalid_date"))
-                    continue
+            # 按当前历法验证日期合法性 | Validate date legality by the current calendar
+            if not calendars.current_calendar.is_valid_date(year, month, day):
+                print(get_text("invalid_date"))
+                continue
             
             result = process_date(year, month, day)
             print(f"\n{result}。")
@@ -139,31 +124,96 @@ def interactive_mode():
             if result:
                 print(f"\n{result}。")
 
+def filter_mode(order: str) -> None:
+    """
+    过滤模式：从标准输入读取日期，将结果写入标准输出 | Filter mode: read dates from stdin and write results to stdout
+    
+    参数 | Parameters:
+        order: 歧义日期的解析顺序策略 | Parsing order policy for ambiguous dates
+    """
+    # 无法解码的字节替换为替换字符，使该行成为错误行而不是中断管道 | Undecodable bytes become replacement characters, so the line turns into an error line instead of breaking the pipeline
+    in_stream = open(sys.stdin.fileno(), "r", encoding="utf-8", errors="replace", buffering=FILTER_BUFFER_SIZE, closefd=False)
+    out_stream = open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=FILTER_BUFFER_SIZE, closefd=False)
+    try:
+        try:
+            process_stream(in_stream, out_stream, order)
+        finally:
+            # 出错时也要写出已缓冲的结果 | Write out buffered results even when an error occurs
+            out_stream.flush()
+    except BrokenPipeError:
+        # 下游已关闭管道：将剩余输出重定向到空设备后安静退出 | Downstream closed the pipe: redirect remaining output to devnull and exit quietly
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
 def main():
     """命令行入口函数 | Command line entry function"""
     # 检测并设置语言 | Detect and set language
     lang = detect_language()
     set_language(lang)
     
-    if len(sys.argv) > 1:
-        # 检查是否有语言参数 | Check if there are language parameters
-        if sys.argv[1].lower() in ["--lang=zh", "--language=zh", "--zh"]:
+    # 检查是否有语言和历法参数 | Check if there are language and calendar parameters
+    while len(sys.argv) > 1:
+        option = sys.argv[1].lower()
+        if option in ["--lang=zh", "--language=zh", "--zh"]:
             set_language("zh")
-            sys.argv.pop(1)
-        elif sys.argv[1].lower() in ["--lang=en", "--language=en", "--en"]:
+        elif option in ["--lang=en", "--language=en", "--en"]:
             set_language("en")
-            sys.argv.pop(1)
+        elif option.startswith("--calendar="):
+            try:
+                set_calendar(get_calendar(option.split("=", 1)[1]))
+            except ValueError as ve:
+                print(ve)
+                return
+        else:
+            break
+        sys.argv.pop(1)
     
     if len(sys.argv) > 1:
         if sys.argv[1] == "batch":
-            if len(sys.argv) < 4:
+            args = sys.argv[2:]
+            workers = None
+            incremental = False
+            order = None
+            # 解析批量处理选项 | Parse batch processing options
+            for arg in list(args):
+                if arg == "--incremental":
+                    incremental = True
+                    args.remove(arg)
+                elif arg.startswith("--order="):
+                    order = arg.split("=", 1)[1].lower()
+                    if order not in DATE_ORDERS:
+                        print(get_text("batch_usage"))
+                        return
+                    args.remove(arg)
+                elif arg.startswith("--workers="):
+                    value = arg.split("=", 1)[1]
+                    try:
+                        workers = int(value)
+                    except ValueError:
+                        workers = 0
+                    if workers < 1:
+                        print(get_text("invalid_workers", value))
+                        return
+                    args.remove(arg)
+            if len(args) < 2:
                 print(get_text("batch_mode"))
                 print(get_text("batch_usage"))
                 print(get_text("batch_modes"))
                 return
-            file_path = sys.argv[2]
-            mode_choice = sys.argv[3]
-            process_batch_file(file_path, mode_choice)
+            paths = args[:-1]
+            mode_choice = args[-1]
+            process_batch_files(paths, mode_choice, workers, incremental, order)
+            return
+        elif sys.argv[1] == "filter":
+            order = "ymd"
+            for arg in sys.argv[2:]:
+                if arg.startswith("--order=") and arg.split("=", 1)[1].lower() in DATE_ORDERS:
+                    order = arg.split("=", 1)[1].lower()
+                else:
+                    print(get_text("filter_usage"), file=sys.stderr)
+                    sys.exit(2)
+            filter_mode(order)
             return
         elif sys.argv[1] == "test":
             # 测试模式由主程序处理 | Test mode is handled by the main program
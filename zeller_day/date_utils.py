@@ -10,7 +10,10 @@ from typing import Tuple, Optional
 
 from zeller_day.language import get_text
 
-def validate_date_input(date_str: str) -> Tuple[int, int, int]:
+# 歧义日期的解析顺序策略 | Parsing order policies for ambiguous dates
+DATE_ORDERS = ("ymd", "dmy", "mdy")
+
+def validate_date_input(date_str: str, order: Optional[str] = None) -> Tuple[int, int, int]:
     """
     使用 datetime 模块验证日期字符串是否合法。 | Validate if a date string is legal using the datetime module.
     接受多种日期格式，包括但不限于： | Accepts multiple date formats, including but not limited to:
@@ -19,8 +22,10 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
       MM-DD-YYYY, MM.DD.YYYY, MM/DD/YYYY。
     对于存在歧义的输入（例如所有数字均小于等于31的情况，如 3-2-1）， | For ambiguous inputs (e.g., when all numbers are less than or equal to 31, such as 3-2-1),
     将通过交互提示让用户选择解析方式。 | the user will be prompted to choose the parsing method.
+    如果指定了 order（"ymd"、"dmy" 或 "mdy"），则按该策略解析歧义输入，不再提示。 | If order ("ymd", "dmy" or "mdy") is given, ambiguous input is resolved by that policy without prompting.
     返回一个元组 (year, month, day)。 | Returns a tuple (year, month, day).
     如果格式错误或日期无效，则抛出 ValueError。 | Raises ValueError if the format is incorrect or the date is invalid.
+    2月29日是否存在取决于历法（例如儒略历的1700年），因此不检查闰年，由调用方按历法验证。 | Whether February 29 exists depends on the calendar (e.g. 1700 in the Julian calendar), so leap years are not checked and callers validate by calendar.
     """
     date_str = date_str.strip()
     delimiter = None
@@ -72,7 +77,16 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
         fmt_choice = None
         # 如果仍然无法确定年份，则提示用户选择解析方式 | If the year still cannot be determined, prompt the user to choose the parsing method
         if year_index is None:
-            if sys.stdin.isatty():
+            if order is not None:
+                if order == "dmy":
+                    year_index = 2
+                    fmt_choice = 2
+                elif order == "mdy":
+                    year_index = 2
+                    fmt_choice = 3
+                else:
+                    year_index = 0
+            elif sys.stdin.isatty():
                 print(get_text("date_format_ambiguous"))
                 print(get_text("format_ymd"))
                 print(get_text("format_dmy"))
@@ -88,6 +102,9 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
                     year_index = 0
             else:
                 raise ValueError(get_text("date_format_error") + get_text("cannot_determine_year"))
+    # 年份只能位于首位或末位 | The year can only be the first or the last part
+    if year_index not in (0, 2):
+        raise ValueError(get_text("date_format_error") + get_text("cannot_identify_year"))
     # 针对负年份的处理：直接返回，不使用 datetime 验证 | Handling for negative years: directly return without using datetime validation
     try:
         int_year = int(parts[year_index])
@@ -105,7 +122,11 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
             if a <= 12 and b > 12:
                 return int(parts[2]), int(parts[0]), int(parts[1])
             elif a <= 12 and b <= 12:
-                if sys.stdin.isatty():
+                if order is not None:
+                    if order == "mdy":
+                        return int(parts[2]), int(parts[0]), int(parts[1])
+                    return int(parts[2]), int(parts[1]), int(parts[0])
+                elif sys.stdin.isatty():
                     print(get_text("format_dm_ambiguous"))
                     print(get_text("format_dm_1"))
                     print(get_text("format_dm_2"))
@@ -145,7 +166,12 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
             if a <= 12 and b > 12:
                 fmt = f"%m{delimiter}%d{delimiter}%Y"
             elif a <= 12 and b <= 12:
-                if sys.stdin.isatty():
+                if order is not None:
+                    if order == "mdy":
+                        fmt = f"%m{delimiter}%d{delimiter}%Y"
+                    else:
+                        fmt = f"%d{delimiter}%m{delimiter}%Y"
+                elif sys.stdin.isatty():
                     print(get_text("format_dm_ambiguous"))
                     print(get_text("format_dm_1"))
                     print(get_text("format_dm_2"))
@@ -168,6 +194,9 @@ def validate_date_input(date_str: str) -> Tuple[int, int, int]:
         date_obj = datetime.datetime.strptime(new_date_str, fmt)
         return date_obj.year, date_obj.month, date_obj.day
     except ValueError as e:
+        fields = dict(zip(fmt.split(delimiter), parts))
+        if all(field.isdigit() for field in fields.values()) and int(fields["%m"]) == 2 and int(fields["%d"]) == 29 and int(fields["%Y"]) > 0:
+            return int(fields["%Y"]), 2, 29
         raise ValueError(get_text("date_format_error") + get_text("check_date_numbers")) from e
 
 def is_valid_date(year: int, month: int, day: int) -> bool:
@@ -4,21 +4,47 @@ ZellerDay输入输出工具 | ZellerDay Input/Output Tools
 包含日志记录和文件处理功能 | Contains logging and file processing functionality
 """
 
+import io
 import os
+import sys
+import glob
+import json
+import shutil
+import hashlib
 import datetime
-from typing import List, Tuple
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional, TextIO, Dict, Any, Callable
 from pathlib import Path
 
-from zeller_day.date_utils import validate_date_input, is_valid_date, format_date
-from zeller_day.core import calculate_weekday, map_weekday
+from zeller_day import calendars, language
+from zeller_day.date_utils import validate_date_input
 from zeller_day.language import get_text
+from zeller_day.output_writer import OutputWriter, ResultFormatter, PADDED_NUMBERS, OUTPUT_CHUNK_ROWS
 
 # 日志目录 | Log directory
 LOG_DIR = Path("data") / "logs"
 
+# 结果文件后缀 | Result file suffix
+RESULT_SUFFIX = "_result"
+
+# 增量处理清单后缀，清单保存在结果文件旁边 | Incremental manifest suffix, the manifest is stored next to the result file
+MANIFEST_SUFFIX = ".manifest"
+
+# 校验已处理前缀时每次读取的字节数 | Bytes read at a time when verifying the processed prefix
+HASH_CHUNK_SIZE = 1 << 20
+
+# 日志写入锁，供批量线程池共享 | Log write lock, shared by the batch thread pool
+_log_lock = threading.Lock()
+_ready_log_dir = None
+
 def ensure_log_dir():
-    """确保日志目录存在 | Ensure log directory exists"""
-    os.makedirs(LOG_DIR, exist_ok=True)
+    """确保日志目录存在（每个目录每个进程只创建一次） | Ensure log directory exists (created once per directory per process)"""
+    global _ready_log_dir
+    if _ready_log_dir != LOG_DIR:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        _ready_log_dir = LOG_DIR
 
 def log_query(query: str, result: str):
     """
@@ -28,75 +54,387 @@ def log_query(query: str, result: str):
         query: 查询内容 | Query content
         result: 查询结果 | Query result
     """
+    log_queries([(query, result)])
+
+def log_queries(entries: List[Tuple[str, str]]):
+    """
+    一次性将多条日期查询记录到日志文件 | Record several date queries to the log file at once
+    
+    参数 | Parameters:
+        entries: (查询内容, 查询结果) 列表 | List of (query content, query result)
+    """
+    if not entries:
+        return
     ensure_log_dir()
     now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_line = f"{now} - {query} -> {result}\n"
+    log_text = "".join(f"{now} - {query} -> {result}\n" for query, result in entries)
     log_file = LOG_DIR / "query_history.log"
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(log_line)
+    with _log_lock:
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(log_text)
 
-def process_batch_file(file_path: str, mode_choice: str) -> None:
+def process_batch_line(date_str: str, order: Optional[str] = None, quiet: bool = False,
+                       formatter: Optional[ResultFormatter] = None,
+                       log_entries: Optional[List[Tuple[str, str]]] = None,
+                       before_print: Optional[Callable[[], None]] = None) -> Tuple[str, bool]:
+    """
+    处理批量文件中的一行日期 | Process one date line of a batch file
+    
+    参数 | Parameters:
+        date_str: 去除首尾空白的日期字符串 | Date string with surrounding whitespace stripped
+        order: 歧义日期的解析顺序策略，None表示按原有方式处理 | Parsing order policy for ambiguous dates, None for the default behaviour
+        quiet: 为True时不输出调试信息、不记录日志 | When True, print no debug information and write no log entry
+        formatter: 预编译的结果格式化器，None表示按当前语言和历法新建 | Precompiled result formatter, None to create one for the current language and calendar
+        log_entries: 若指定，日志记录追加到该列表而不是立即写入 | If given, log entries are appended to this list instead of being written immediately
+        before_print: 若指定，输出调试信息前调用 | If given, called before debug information is printed
+        
+    返回 | Returns:
+        (结果行, 是否成功) | (Result line, whether it succeeded)
+    """
+    try:
+        year, month, day = validate_date_input(date_str, order)
+    except ValueError as ve:
+        return get_text("invalid_date_error", date_str, ve), False
+    if formatter is None:
+        formatter = ResultFormatter()
+    calendar = formatter.calendar
+    # 按所用历法的闰年规则验证日期合法性 | Validate the date by the leap year rule of the calendar in use
+    if not calendar.is_valid_date(year, month, day):
+        return get_text("date_illegal", date_str), False
+    if year <= 0 and not quiet:
+        if before_print is not None:
+            before_print()
+        print(get_text("astronomical_year", year, year + 1))
+    # 直接调用历法，省去 calculate_weekday 的分派开销 | Call the calendar directly to skip the dispatch overhead of calculate_weekday
+    try:
+        weekday_index = calendar.weekday(year, month, day)
+    except ValueError as ve:
+        return get_text("invalid_date_error", date_str, ve), False
+    result_str = formatter.format_result(date_str, year, month, day, weekday_index)
+    if not quiet:
+        entry = (f"{year:04d}-{PADDED_NUMBERS[month]}-{PADDED_NUMBERS[day]}", formatter.weekdays[weekday_index])
+        if log_entries is None:
+            log_query(*entry)
+        else:
+            log_entries.append(entry)
+    return result_str, True
+
+def _process_lines(lines: List[str], writer: OutputWriter, order: Optional[str] = None) -> Tuple[int, int]:
+    """
+    处理多行日期并将结果行写入输出写入器 | Process date lines and write the result lines to an output writer
+    
+    参数 | Parameters:
+        lines: 输入行列表 | List of input lines
+        writer: 输出写入器 | Output writer
+        order: 歧义日期的解析顺序策略，None表示按原有方式处理 | Parsing order policy for ambiguous dates, None for the default behaviour
+        
+    返回 | Returns:
+        (成功处理的日期数, 错误行数) | (Number of dates processed, number of error lines)
+    """
+    formatter = ResultFormatter()
+    log_entries = []
+    write = writer.write
+    # 可能交互提示时，每行之前先写出已回显的结果，保持输出顺序 | When prompts are possible, write out echoed results before each line to keep the output in order
+    prompting = order is None and sys.stdin.isatty()
+    processed = 0
+    errors = 0
+    for line in lines:
+        date_str = line.strip()
+        if not date_str:
+            write("\n")
+            continue
+        if prompting:
+            writer.flush_echo()
+        result_str, ok = process_batch_line(date_str, order, formatter=formatter, log_entries=log_entries,
+                                            before_print=writer.flush_echo)
+        write(result_str + "\n")
+        if ok:
+            processed += 1
+        else:
+            errors += 1
+        if len(log_entries) >= OUTPUT_CHUNK_ROWS:
+            log_queries(log_entries)
+            log_entries.clear()
+    log_queries(log_entries)
+    return processed, errors
+
+def _load_manifest(manifest_path: str) -> Optional[Dict[str, Any]]:
+    """
+    读取增量处理清单，文件不存在或内容损坏时返回None | Load the incremental processing manifest, or None if it is missing or corrupt
+    
+    参数 | Parameters:
+        manifest_path: 清单文件路径 | Manifest file path
+        
+    返回 | Returns:
+        清单字典或None | Manifest dictionary or None
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not all(isinstance(manifest.get(k), t) for k, t in (("offset", int), ("result_size", int), ("sha256", str), ("language", str), ("calendar", str))):
+        return None
+    # 交互提示时解析策略记为None | The order policy is recorded as None when prompting
+    if "order" not in manifest or not (manifest["order"] is None or isinstance(manifest["order"], str)):
+        return None
+    return manifest
+
+def _process_batch_file_incremental(file_path: str, new_file: str, order: Optional[str] = None) -> Tuple[int, int]:
+    """
+    增量处理批量文件：校验已处理前缀未被修改后，只处理新追加的完整行并追加到结果文件。 | Incrementally process a batch file: after verifying the processed prefix is unchanged, process only newly appended complete lines and append them to the result file.
+    前缀被修改、结果文件缺失、清单无效或语言、历法、解析顺序策略与上次不同时，从头重新处理。 | If the prefix changed, the result file is missing, the manifest is invalid, or the language, calendar or order policy differs from the last run, the file is reprocessed from the start.
+    末尾没有换行符的不完整行留到下次处理。 | A trailing line without a newline is left for the next run.
+    
+    参数 | Parameters:
+        file_path: 文件路径 | File path
+        new_file: 结果文件路径 | Result file path
+        order: 歧义日期的解析顺序策略 | Parsing order policy for ambiguous dates
+        
+    返回 | Returns:
+        (成功处理的日期数, 错误行数) | (Number of dates processed, number of error lines)
+    """
+    manifest_path = new_file + MANIFEST_SUFFIX
+    manifest = _load_manifest(manifest_path)
+    hasher = hashlib.sha256()
+    offset = 0
+    with open(file_path, "rb") as f:
+        if (manifest is not None and os.path.exists(new_file)
+                and manifest["language"] == language.current_language
+                and manifest["calendar"] == calendars.current_calendar.name
+                and manifest["order"] == order
+                and os.path.getsize(new_file) == manifest["result_size"]
+                and os.path.getsize(file_path) >= manifest["offset"]):
+            remaining = manifest["offset"]
+            while remaining > 0:
+                chunk = f.read(min(remaining, HASH_CHUNK_SIZE))
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                remaining -= len(chunk)
+            if remaining == 0 and hasher.hexdigest() == manifest["sha256"]:
+                offset = manifest["offset"]
+            else:
+                hasher = hashlib.sha256()
+                f.seek(0)
+        data = f.read()
+
+    # 只处理以换行符结尾的完整行 | Only process complete lines ending with a newline
+    data = data[:data.rfind(b"\n") + 1]
+    hasher.update(data)
+    if offset:
+        print(get_text("incremental_resume", offset))
+    with OutputWriter(new_file, "a" if offset else "w", echo=True) as writer:
+        # 与全量处理的 readlines() 按相同的规则分行 | Split lines by the same rules as readlines() in a full run
+        lines = io.StringIO(data.decode("utf-8"), newline=None).readlines()
+        processed, errors = _process_lines(lines, writer, order)
+    manifest = {
+        "offset": offset + len(data),
+        "result_size": os.path.getsize(new_file),
+        "sha256": hasher.hexdigest(),
+        "language": language.current_language,
+        "calendar": calendars.current_calendar.name,
+        "order": order,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return processed, errors
+
+def process_batch_file(file_path: str, mode_choice: str, incremental: bool = False, order: Optional[str] = None) -> Optional[Tuple[int, int]]:
     """
     处理批量文件，根据模式选择导出结果到新文件或修改原文件。 | Process batch files, choose to export results to a new file or modify the original file based on the mode.
     
     参数 | Parameters:
         file_path: 文件路径 | File path
         mode_choice: 处理模式（"1"导出新文件，"2"修改原文件） | Processing mode ("1" export to new file, "2" modify original file)
+        incremental: 是否只处理上次运行后新追加的行（仅支持模式"1"） | Whether to process only lines appended since the last run (mode "1" only)
+        order: 歧义日期的解析顺序策略，None表示交互提示 | Parsing order policy for ambiguous dates, None to prompt interactively
+        
+    返回 | Returns:
+        (成功处理的日期数, 错误行数)，文件不存在或模式无效时返回None | (Number of dates processed, number of error lines), or None if the file does not exist or the mode is invalid
     """
     if not os.path.exists(file_path):
         print(get_text("file_not_exist", file_path))
-        return
+        return None
+    if mode_choice not in ("1", "2"):
+        print(get_text("invalid_mode"))
+        return None
+    if incremental and mode_choice != "1":
+        print(get_text("incremental_mode_unsupported"))
+        return None
 
     print(get_text("batch_start", file_path) + "\n")
+    base, ext = os.path.splitext(file_path)
+    new_file = f"{base}{RESULT_SUFFIX}{ext}"
+    if incremental:
+        processed, errors = _process_batch_file_incremental(file_path, new_file, order)
+        print(get_text("result_exported", new_file))
+        return processed, errors
+
     with open(file_path, "r", encoding="utf-8") as f:
         lines = f.readlines()
 
-    new_lines = []
-    for line in lines:
-        original_line = line.rstrip("\n")
-        date_str = original_line.strip()
-        if not date_str:
-            new_lines.append("\n")
-            continue
-        try:
-            year, month, day = validate_date_input(date_str)
-        except ValueError as ve:
-            error_msg = get_text("invalid_date_error", date_str, ve)
-            print(error_msg)
-            new_lines.append(error_msg + "\n")
-            continue
-        # 对于正年份使用 datetime 验证, 对于非正年份使用自定义验证 | Use datetime validation for positive years, use custom validation for non-positive years
-        if year > 0:
-            try:
-                datetime.datetime(year, month, day)
-            except ValueError:
-                error_msg = get_text("date_illegal", date_str)
-                print(error_msg)
-                new_lines.append(error_msg + "\n")
-                continue
-        else:
-            if not is_valid_date(year, month, day):
-                error_msg = get_text("date_illegal", date_str)
-                print(error_msg)
-                new_lines.append(error_msg + "\n")
-                continue
-        weekday_index = calculate_weekday(year, month, day)
-        weekday_str = map_weekday(weekday_index)
-        formatted_date = format_date(year, month, day)
-        result_str = get_text("batch_result", date_str, year, month, day, weekday_str)
-        print(result_str)
-        log_query(f"{year:04d}-{month:02d}-{day:02d}", weekday_str)
-        new_lines.append(result_str + "\n")
-
     if mode_choice == "1":
-        base, ext = os.path.splitext(file_path)
-        new_file = f"{base}_result{ext}"
-        with open(new_file, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        with OutputWriter(new_file, "w", echo=True) as writer:
+            processed, errors = _process_lines(lines, writer, order)
+        # 全量重写后旧的增量清单已失效 | A full rewrite invalidates any previous incremental manifest
+        if os.path.exists(new_file + MANIFEST_SUFFIX):
+            os.remove(new_file + MANIFEST_SUFFIX)
         print(get_text("result_exported", new_file))
-    elif mode_choice == "2":
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
-        print(get_text("file_modified", file_path))
     else:
-        print(get_text("invalid_mode"))
\ No newline at end of file
+        # 先写入临时文件再替换原文件，处理中断时原文件保持不变；符号链接替换其指向的文件 | Write to a temporary file first and then replace the original, so an interrupted run leaves the original intact; a symlink has its target replaced
+        target = os.path.realpath(file_path)
+        fd, temp_file = tempfile.mkstemp(prefix=f".{os.path.basename(target)}.", suffix=".tmp",
+                                         dir=os.path.dirname(target))
+        os.close(fd)
+        try:
+            with OutputWriter(temp_file, "w", echo=True) as writer:
+                processed, errors = _process_lines(lines, writer, order)
+            # mkstemp 创建的文件权限为0600，替换前复制原文件的权限 | mkstemp creates the file with mode 0600, so copy the original permissions before replacing
+            shutil.copymode(target, temp_file)
+            os.replace(temp_file, target)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        print(get_text("file_modified", file_path))
+    return processed, errors
+
+def is_result_file(file_path: str) -> bool:
+    """
+    判断文件是否为批量处理生成的结果文件 | Determine whether a file is a result file generated by batch processing
+    
+    参数 | Parameters:
+        file_path: 文件路径 | File path
+        
+    返回 | Returns:
+        布尔值表示是否为结果文件 | Boolean indicating whether it is a result file
+    """
+    if file_path.endswith(MANIFEST_SUFFIX):
+        return True
+    base, _ = os.path.splitext(os.path.basename(file_path))
+    return base.endswith(RESULT_SUFFIX)
+
+def _is_log_path(path: str) -> bool:
+    """判断路径是否位于日志目录中 | Determine whether a path is inside the log directory"""
+    log_dir = os.path.realpath(LOG_DIR)
+    path = os.path.realpath(path)
+    return path == log_dir or path.startswith(log_dir + os.sep)
+
+def collect_batch_files(patterns: List[str]) -> List[str]:
+    """
+    将文件路径、通配符和目录展开为待处理的文件列表。 | Expand file paths, glob patterns and directories into a list of files to process.
+    目录会被递归遍历，已生成的结果文件和日志目录会被跳过。 | Directories are walked recursively, and previously generated result files and the log directory are skipped.
+    
+    参数 | Parameters:
+        patterns: 文件路径、通配符或目录 | File paths, glob patterns or directories
+        
+    返回 | Returns:
+        去重后的文件路径列表，同一文件只保留第一次出现的写法 | De-duplicated list of file paths, keeping the first spelling of each file
+    """
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, names in os.walk(pattern):
+                dirs[:] = sorted(d for d in dirs if not _is_log_path(os.path.join(root, d)))
+                for name in sorted(names):
+                    path = os.path.join(root, name)
+                    if not is_result_file(path):
+                        files.append(path)
+        elif glob.has_magic(pattern):
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(path) and not is_result_file(path) and not _is_log_path(path):
+                    files.append(path)
+        else:
+            # 普通路径原样保留，不存在时由 process_batch_file 报告 | Plain paths are kept as-is; process_batch_file reports missing ones
+            files.append(pattern)
+    # 按真实路径去重，避免同一文件被并发处理两次 | De-duplicate by real path so the same file is never processed twice concurrently
+    unique = {}
+    for path in files:
+        unique.setdefault(os.path.realpath(path), path)
+    return list(unique.values())
+
+def _process_batch_file_safely(file_path: str, mode_choice: str, incremental: bool = False,
+                               order: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """处理单个批量文件，出错时输出错误并返回None，不影响其他文件 | Process one batch file, printing the error and returning None on failure without affecting other files"""
+    try:
+        return process_batch_file(file_path, mode_choice, incremental, order)
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        print(get_text("batch_file_error", file_path, e))
+        return None
+
+def process_batch_files(patterns: List[str], mode_choice: str, workers: Optional[int] = None, incremental: bool = False,
+                        order: Optional[str] = None) -> Optional[Tuple[int, int, int]]:
+    """
+    使用共享线程池并发处理多个批量文件，并输出汇总信息。 | Process multiple batch files concurrently on a shared thread pool and print a summary.
+    
+    参数 | Parameters:
+        patterns: 文件路径、通配符或目录 | File paths, glob patterns or directories
+        mode_choice: 处理模式（"1"导出新文件，"2"修改原文件） | Processing mode ("1" export to new file, "2" modify original file)
+        workers: 线程数，None表示使用默认值 | Number of threads, None for the default
+        incremental: 是否只处理新追加的行 | Whether to process only newly appended lines
+        order: 歧义日期的解析顺序策略，None表示交互提示 | Parsing order policy for ambiguous dates, None to prompt interactively
+        
+    返回 | Returns:
+        (处理的文件数, 成功处理的日期数, 错误行数)，模式无效或没有文件时返回None | (Files processed, dates processed, error lines), or None if the mode is invalid or there are no files
+    """
+    if mode_choice not in ("1", "2"):
+        print(get_text("invalid_mode"))
+        return None
+    if incremental and mode_choice != "1":
+        print(get_text("incremental_mode_unsupported"))
+        return None
+    files = collect_batch_files(patterns)
+    if not files:
+        print(get_text("batch_no_files"))
+        return None
+
+    # 没有解析策略且可能交互提示时只使用一个线程，避免多个线程同时读取输入 | Use a single thread when no order policy is given and prompts are possible, so threads never read input concurrently
+    if order is None and sys.stdin.isatty():
+        workers = 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda path: _process_batch_file_safely(path, mode_choice, incremental, order), files))
+
+    file_count = 0
+    processed = 0
+    errors = 0
+    failed = 0
+    for result in results:
+        if result is None:
+            failed += 1
+            continue
+        file_count += 1
+        processed += result[0]
+        errors += result[1]
+    print("\n" + get_text("batch_summary", file_count, processed, errors, failed))
+    return file_count, processed, errors
+
+def process_stream(in_stream: TextIO, out_stream: TextIO, order: str = "ymd") -> Tuple[int, int]:
+    """
+    逐行读取输入流中的日期，并将结果逐行写入输出流，用于Unix管道。 | Read dates line by line from an input stream and write results line by line to an output stream, for Unix pipelines.
+    歧义日期按 order 策略解析，从不提示；不输出调试信息，也不记录日志。 | Ambiguous dates are resolved by the order policy and never prompt; no debug information or log entries are written.
+    每个输入行对应一个输出行，空行原样保留。 | Each input line produces exactly one output line, and empty lines are kept.
+    
+    参数 | Parameters:
+        in_stream: 输入文本流 | Input text stream
+        out_stream: 输出文本流 | Output text stream
+        order: 歧义日期的解析顺序策略（"ymd"、"dmy" 或 "mdy"） | Parsing order policy for ambiguous dates ("ymd", "dmy" or "mdy")
+        
+    返回 | Returns:
+        (成功处理的日期数, 错误行数) | (Number of dates processed, number of error lines)
+    """
+    formatter = ResultFormatter()
+    processed = 0
+    errors = 0
+    write = out_stream.write
+    for line in in_stream:
+        date_str = line.strip()
+        if not date_str:
+            write("\n")
+            continue
+        result_str, ok = process_batch_line(date_str, order, quiet=True, formatter=formatter)
+        write(result_str + "\n")
+        if ok:
+            processed += 1
+        else:
+            errors += 1
+    return processed, errors
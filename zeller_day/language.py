@@ -24,16 +24,23 @@ TEXTS = {
         "thanks": "感谢使用，再见！",
         "result_format": "{} 是 {}",
         "batch_mode": "使用批量处理模式，需要指定文件名和处理模式。",
-        "batch_usage": "用法: python main.py batch <文件路径> <处理模式>",
+        "batch_usage": "用法: python main.py batch [--workers=N] [--incremental] [--order=ymd|dmy|mdy] <文件路径/通配符/目录>... <处理模式>",
         "batch_modes": "处理模式: 1 - 导出到新文件, 2 - 修改原文件",
         "batch_start": "开始批量处理文件：{}",
         "file_not_exist": "错误：文件 {} 不存在。",
         "invalid_date_error": "日期 '{}' 无效：{}",
         "date_illegal": "日期 '{}' 不合法。",
-        "batch_result": "{} -> {}年{:02d}月{:02d}日 是 {}。",
+        "batch_result": "{} -> {} 是 {}。",
         "result_exported": "结果已导出至新文件：{}",
         "file_modified": "原文件 {} 已被修改。",
         "invalid_mode": "无效的处理模式。",
+        "batch_no_files": "没有找到需要处理的文件。",
+        "batch_file_error": "错误：处理文件 {} 失败：{}",
+        "batch_summary": "批量处理完成：共处理 {} 个文件，{} 个日期，{} 行错误，{} 个文件失败。",
+        "invalid_workers": "无效的线程数：{}",
+        "incremental_mode_unsupported": "增量处理只支持处理模式 1（导出到新文件）。",
+        "incremental_resume": "已处理的前 {} 字节未改变，仅处理新追加的内容。",
+        "filter_usage": "用法: python main.py filter [--order=ymd|dmy|mdy]",
         "date_format_ambiguous": "输入日期格式存在歧义，请选择解析方式:",
         "format_ymd": "输入 '1' 代表 年-月-日 (例如 3-2-1 解析为 3年2月1日)",
         "format_dmy": "输入 '2' 代表 日-月-年 (例如 3-2-1 解析为 1年2月3日)",
@@ -51,7 +58,9 @@ TEXTS = {
         "check_date_numbers": "请检查日期数字。",
         "cannot_identify_year": "无法识别年份位置。",
         "month_not_gt_12": "月份不可能大于12。",
-        "calendar_gap": "输入日期处于历法转换空档期（1582年10月5日至10月14日）",
+        "calendar_gap": "输入日期处于历法转换空档期（{}至{}）",
+        "invalid_cutover": "无效的历法转换日期：{}",
+        "unknown_calendar": "未知的历法：{}（可选：{}，或 hybrid:YYYY-MM-DD）",
         "weekdays": ["星期六", "星期日", "星期一", "星期二", "星期三", "星期四", "星期五"],
         "unknown_weekday": "未知星期",
         "date_format": "{:04d}年{:02d}月{:02d}日",
@@ -70,7 +79,7 @@ TEXTS = {
         "thanks": "Thank you for using ZellerDay, goodbye!",
         "result_format": "{} is {}",
         "batch_mode": "Using batch processing mode, you need to specify the filename and processing mode.",
-        "batch_usage": "Usage: python main.py batch <file_path> <processing_mode>",
+        "batch_usage": "Usage: python main.py batch [--workers=N] [--incremental] [--order=ymd|dmy|mdy] <file_path/glob/directory>... <processing_mode>",
         "batch_modes": "Processing modes: 1 - Export to a new file, 2 - Modify the original file",
         "batch_start": "Starting batch processing of file: {}",
         "file_not_exist": "Error: File {} does not exist.",
@@ -80,6 +89,13 @@ TEXTS = {
         "result_exported": "Results have been exported to a new file: {}",
         "file_modified": "The original file {} has been modified.",
         "invalid_mode": "Invalid processing mode.",
+        "batch_no_files": "No files found to process.",
+        "batch_file_error": "Error: Failed to process file {}: {}",
+        "batch_summary": "Batch processing finished: {} files, {} dates processed, {} error lines, {} files failed.",
+        "invalid_workers": "Invalid number of workers: {}",
+        "incremental_mode_unsupported": "Incremental processing only supports processing mode 1 (export to a new file).",
+        "incremental_resume": "The first {} processed bytes are unchanged, only newly appended content will be processed.",
+        "filter_usage": "Usage: python main.py filter [--order=ymd|dmy|mdy]",
         "date_format_ambiguous": "The date format is ambiguous, please choose an interpretation:",
         "format_ymd": "Enter '1' for Year-Month-Day (e.g. 3-2-1 interpreted as Year 3, Month 2, Day 1)",
         "format_dmy": "Enter '2' for Day-Month-Year (e.g. 3-2-1 interpreted as Year 1, Month 2, Day 3)",
@@ -97,7 +113,9 @@ TEXTS = {
         "check_date_numbers": "please check the date numbers.",
         "cannot_identify_year": "cannot identify the year position.",
         "month_not_gt_12": "month cannot be greater than 12.",
-        "calendar_gap": "Input date is in the calendar conversion gap period (October 5-14, 1582)",
+        "calendar_gap": "Input date is in the calendar conversion gap period ({} to {})",
+        "invalid_cutover": "Invalid calendar cutover date: {}",
+        "unknown_calendar": "Unknown calendar: {} (available: {}, or hybrid:YYYY-MM-DD)",
         "weekdays": ["Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
         "unknown_weekday": "Unknown weekday",
         "date_format": "{:04d}-{:02d}-{:02d}",
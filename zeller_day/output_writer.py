@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+ZellerDay输出写入模块 | ZellerDay Output Writer Module
+包含预先格式化的字符串表和批量输出的缓冲写入器 | Contains preformatted string tables and the buffered writer for batch output
+"""
+
+import codecs
+import io
+import string
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from zeller_day import calendars, language
+from zeller_day.calendars import Calendar
+
+# 输出文件缓冲区大小 | Output file buffer size
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# 每次合并编码并写入的行数 | Number of rows joined, encoded and written at a time
+OUTPUT_CHUNK_ROWS = 4096
+
+# 补零的月份和日期字符串 "00".."31" | Zero-padded month and day strings "00".."31"
+PADDED_NUMBERS = tuple(sys.intern(f"{n:02d}") for n in range(32))
+
+_weekday_tables: Dict[str, Tuple[str, ...]] = {}
+
+def weekday_table(lang_code: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    获取指定语言的星期名称表（字符串已驻留） | Get the weekday name table for a language (strings are interned)
+    
+    参数 | Parameters:
+        lang_code: 语言代码，None表示当前语言 | Language code, None for the current language
+    
+    返回 | Returns:
+        按 calculate_weekday 返回值索引的星期名称 | Weekday names indexed by the value returned by calculate_weekday
+    """
+    lang_code = lang_code or language.current_language
+    table = _weekday_tables.get(lang_code)
+    if table is None:
+        table = tuple(sys.intern(name) for name in language.TEXTS[lang_code]["weekdays"])
+        _weekday_tables[lang_code] = table
+    return table
+
+def _literals(template: str) -> List[str]:
+    """拆分格式模板中字段前后的文字部分，n个字段得到n+1段 | Split the literal text around the fields of a format template, n fields give n+1 pieces"""
+    literals = []
+    field_name = None
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        literals.append(literal)
+    if field_name is not None:
+        literals.append("")
+    return literals
+
+class ResultFormatter:
+    """
+    批量结果行格式化器：创建时预编译当前语言的模板，逐行时只做查表和字符串拼接 | Batch result line formatter: templates of the current language are precompiled on creation, so each row is only table lookups and string concatenation
+    """
+
+    def __init__(self, calendar: Optional[Calendar] = None, lang_code: Optional[str] = None):
+        """
+        参数 | Parameters:
+            calendar: 使用的历法，None表示当前历法 | Calendar to use, None for the current calendar
+            lang_code: 语言代码，None表示当前语言 | Language code, None for the current language
+        """
+        lang_code = lang_code or language.current_language
+        texts = language.TEXTS[lang_code]
+        self.calendar = calendar or calendars.current_calendar
+        self.weekdays = weekday_table(lang_code)
+        # 历法自定义了日期格式时（例如ISO周历）直接调用历法 | Call the calendar directly when it customises the date format (e.g. ISO week date)
+        self._custom_date = type(self.calendar).format_date is not Calendar.format_date
+        self._year_prefix, self._month_prefix, self._day_prefix, self._date_suffix = _literals(texts["date_format"])
+        self._result_prefix, self._date_sep, self._weekday_sep, self._result_suffix = _literals(texts["batch_result"])
+
+    def format_date(self, year: int, month: int, day: int) -> str:
+        """
+        格式化日期，与 Calendar.format_date 的结果相同 | Format a date, same result as Calendar.format_date
+        
+        参数 | Parameters:
+            year: 年份 | Year
+            month: 月份 | Month
+            day: 日期 | Day
+        
+        返回 | Returns:
+            格式化的日期字符串 | Formatted date string
+        """
+        if self._custom_date:
+            return self.calendar.format_date(year, month, day)
+        return self._year_prefix + f"{year:04d}" + self._month_prefix + PADDED_NUMBERS[month] + self._day_prefix + PADDED_NUMBERS[day] + self._date_suffix
+
+    def format_result(self, date_str: str, year: int, month: int, day: int, weekday_index: int) -> str:
+        """
+        格式化批量结果行，与 get_text("batch_result", ...) 的结果相同 | Format a batch result line, same result as get_text("batch_result", ...)
+        
+        参数 | Parameters:
+            date_str: 原始日期字符串 | Original date string
+            year: 年份 | Year
+            month: 月份 | Month
+            day: 日期 | Day
+            weekday_index: calculate_weekday 的返回值 | Value returned by calculate_weekday
+        
+        返回 | Returns:
+            结果行（不含换行符） | Result line (without newline)
+        """
+        return (self._result_prefix + date_str + self._date_sep + self.format_date(year, month, day)
+                + self._weekday_sep + self.weekdays[weekday_index] + self._result_suffix)
+
+def _is_utf8(stream) -> bool:
+    """判断文本流是否使用UTF-8编码 | Determine whether a text stream uses UTF-8 encoding"""
+    try:
+        return codecs.lookup(stream.encoding).name == "utf-8"
+    except (AttributeError, LookupError, TypeError):
+        return False
+
+class OutputWriter:
+    """
+    批量输出写入器：将结果行累积成块，每块只合并、编码一次，再写入大缓冲区的 io.BufferedWriter。 | Batch output writer: result rows are accumulated into chunks, each chunk is joined and encoded once and written to a large io.BufferedWriter.
+    echo 为True时，同一份编码后的数据也会按块写入标准输出。 | When echo is True, the same encoded data is also written to stdout chunk by chunk.
+    """
+
+    def __init__(self, file_path: str, mode: str = "w", echo: bool = False, buffer_size: int = OUTPUT_BUFFER_SIZE, chunk_rows: int = OUTPUT_CHUNK_ROWS):
+        """
+        参数 | Parameters:
+            file_path: 输出文件路径 | Output file path
+            mode: "w" 覆盖写入，"a" 追加写入 | "w" to overwrite, "a" to append
+            echo: 是否同时输出到标准输出 | Whether to also write to stdout
+            buffer_size: 文件缓冲区大小 | File buffer size
+            chunk_rows: 每块的行数 | Number of rows per chunk
+        """
+        self._file = io.BufferedWriter(io.FileIO(file_path, mode), buffer_size=buffer_size)
+        self._echo = echo
+        self._chunk_rows = chunk_rows
+        self._rows: List[str] = []
+        self.bytes_written = 0
+
+    def write(self, row: str) -> None:
+        """
+        写入一行（需包含换行符） | Write a row (including its newline)
+        
+        参数 | Parameters:
+            row: 结果行 | Result row
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self._chunk_rows:
+            self._write_chunk()
+
+    def _write_chunk(self) -> None:
+        """合并、编码并写出当前块 | Join, encode and write out the current chunk"""
+        if not self._rows:
+            return
+        text = "".join(self._rows)
+        self._rows = []
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self.bytes_written += len(data)
+        if self._echo:
+            stdout = sys.stdout
+            if _is_utf8(stdout) and hasattr(stdout, "buffer"):
+                # 先刷新文本层，保证与 print 的输出顺序一致 | Flush the text layer first to keep ordering with print output
+                stdout.flush()
+                stdout.buffer.write(data)
+                stdout.buffer.flush()
+            else:
+                stdout.write(text)
+
+    def flush_echo(self) -> None:
+        """在调试信息或提示之前写出累积的行，使标准输出保持原有顺序 | Write out accumulated rows before debug information or a prompt, so stdout keeps its original order"""
+        if self._echo:
+            self._write_chunk()
+
+    def flush(self) -> None:
+        """写出累积的行并刷新文件缓冲区 | Write out accumulated rows and flush the file buffer"""
+        self._write_chunk()
+        self._file.flush()
+
+    def close(self) -> None:
+        """写出剩余的行并关闭文件 | Write out the remaining rows and close the file"""
+        try:
+            self._write_chunk()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()